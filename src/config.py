@@ -13,7 +13,9 @@ DEFAULT_CONFIG = {
     "ask_for_next_file": True,
     "default_format": "1",  # 1 = MP4, 2 = WebM
     "default_size": "1",    # 1 = Original
-    "default_bitrate": "1"  # 1 = Auto (Quality-based)
+    "default_bitrate": "1", # 1 = Auto (Quality-based)
+    "default_fps": "1",     # 1 = Auto (based on output size)
+    "default_scaler": "1"   # 1 = Bicubic (Balanced)
 }
 
 # Configuration file path
@@ -99,6 +101,16 @@ def get_default_bitrate():
     config = load_config()
     return config.get("default_bitrate", DEFAULT_CONFIG["default_bitrate"])
 
+def get_default_fps():
+    """Get default fps from config"""
+    config = load_config()
+    return config.get("default_fps", DEFAULT_CONFIG["default_fps"])
+
+def get_default_scaler():
+    """Get default scaler from config"""
+    config = load_config()
+    return config.get("default_scaler", DEFAULT_CONFIG["default_scaler"])
+
 def create_default_config_if_not_exists():
     """Create default config file if it doesn't exist"""
     if not os.path.exists(CONFIG_FILE):
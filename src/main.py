@@ -32,11 +32,11 @@ SYSTEM_ENCODING = locale.getpreferredencoding()
 
 # Presets
 SIZE_PRESETS = {
-    "1": {"name": "Original", "value": "original"},
-    "2": {"name": "HD (1280p max)", "value": "1280:-1"},
-    "3": {"name": "SD (720p max)", "value": "720:-1"},
-    "4": {"name": "Small (480p max)", "value": "480:-1"},
-    "5": {"name": "Tiny (360p max)", "value": "360:-1"}
+    "1": {"name": "Original", "value": "original", "max_fps": None},
+    "2": {"name": "HD (1280p max)", "value": "1280:-1", "max_fps": None},
+    "3": {"name": "SD (720p max)", "value": "720:-1", "max_fps": 60},
+    "4": {"name": "Small (480p max)", "value": "480:-1", "max_fps": 30},
+    "5": {"name": "Tiny (360p max)", "value": "360:-1", "max_fps": 24}
 }
 
 BITRATE_PRESETS = {
@@ -46,6 +46,20 @@ BITRATE_PRESETS = {
     "4": {"name": "Low Quality (500kbps)", "value": "500k"}
 }
 
+FPS_PRESETS = {
+    "1": {"name": "Auto (based on output size)", "value": "auto"},
+    "2": {"name": "Original", "value": "original"},
+    "3": {"name": "60 fps max", "value": 60},
+    "4": {"name": "30 fps max", "value": 30},
+    "5": {"name": "24 fps max", "value": 24}
+}
+
+SCALER_PRESETS = {
+    "1": {"name": "Bicubic (Balanced)", "value": "bicubic"},
+    "2": {"name": "Fast Bilinear (Fastest)", "value": "fast_bilinear"},
+    "3": {"name": "Lanczos (Sharpest)", "value": "lanczos"}
+}
+
 FORMAT_PRESETS = {
     "1": {"name": "MP4 (H.264)", "ext": "mp4", "codec": "libx264"},
     "2": {"name": "WebM (VP9)", "ext": "webm", "codec": "libvpx-vp9"}
@@ -79,8 +93,34 @@ def parse_time(time_str):
         return hours * 3600 + minutes * 60 + seconds + centiseconds / 100
     return 0
 
+def parse_fps(ffmpeg_output):
+    """Parse video frame rate from FFmpeg output (0 if unknown)"""
+    stream_match = re.search(r"Stream .* Video:.*", ffmpeg_output)
+    if not stream_match:
+        return 0
+    stream_line = stream_match.group(0)
+    # Prefer "fps", fall back to "tbr" when "fps" is missing or abbreviated
+    # (e.g. WebM/MKV streams are often reported as "1k fps, 60 tbr")
+    for label in ("fps", "tbr"):
+        rate_match = re.search(rf"(\d+(?:\.\d+)?)(k?) {label}", stream_line)
+        if rate_match and not rate_match.group(2):
+            return float(rate_match.group(1))
+    return 0
+
+def should_cap_fps(source_fps, max_fps):
+    """Check if frame rate cap applies (only when source is known to exceed it)"""
+    return bool(max_fps) and source_fps > max_fps
+
+def resolve_max_fps(fps_preset, size_preset):
+    """Resolve frame rate cap from fps preset and size preset (None = no cap)"""
+    if fps_preset["value"] == "auto":
+        return size_preset.get("max_fps")
+    if fps_preset["value"] == "original":
+        return None
+    return fps_preset["value"]
+
 def get_video_info(input_file):
-    """Get video information including width, height"""
+    """Get video information including width, height, fps"""
     if not os.path.exists(input_file):
         return None
     
@@ -106,13 +146,13 @@ def get_video_info(input_file):
         if video_pattern:
             width = int(video_pattern.group(1))
             height = int(video_pattern.group(2))
-            return {"width": width, "height": height}
+            return {"width": width, "height": height, "fps": parse_fps(stderr)}
     except Exception as e:
         print(f"Warning: Could not determine video dimensions: {str(e)}")
     
     return None
 
-def encode_video(input_file, size_preset, bitrate_preset, format_preset, progress_callback=None):
+def encode_video(input_file, size_preset, bitrate_preset, format_preset, max_fps=None, scaler="bicubic", progress_callback=None):
     """Encode video"""
     if not os.path.exists(input_file):
         return False, f"Input file not found: {input_file}"
@@ -146,29 +186,41 @@ def encode_video(input_file, size_preset, bitrate_preset, format_preset, progres
         _, stderr = duration_process.communicate()
         
         duration = parse_duration(stderr)
+        source_fps = parse_fps(stderr)
         if progress_callback and duration > 0:
             progress_callback(f"Video duration: {int(duration // 60)}m {int(duration % 60)}s")
     except Exception as e:
         print(f"Warning: Could not determine video duration: {str(e)}")
         duration = 0
+        source_fps = 0
     
     # Build command
     cmd = [FFMPEG_PATH, "-i", input_file, "-v", "warning", "-stats"]
     
+    # Video filters (order matters: drop frames before downscaling so
+    # the scaler only processes frames that will be encoded)
+    filters = []
+    
+    # Frame rate cap (skipped when source is at or below it, to avoid duplicating frames)
+    if should_cap_fps(source_fps, max_fps):
+        filters.append(f"fps={max_fps}")
+    
     # Size setting
     if size_preset != "original":
         # Handle special size presets that maintain aspect ratio
         if ":-1" in size_preset:
             # Format is either "width:-1" or "-1:height"
             parts = size_preset.split(":")
-            if parts[0] != "-1":  # Width is specified
-                cmd.extend(["-vf", f"scale={parts[0]}:{parts[1]}:force_original_aspect_ratio=decrease"])
-            else:  # Height is specified
-                cmd.extend(["-vf", f"scale={parts[0]}:{parts[1]}:force_original_aspect_ratio=decrease"])
+            filters.append(f"scale={parts[0]}:{parts[1]}:force_original_aspect_ratio=decrease:flags={scaler}")
         else:
             # For backward compatibility - fixed resolution (not recommended)
+            # Note: this legacy path uses FFmpeg's default scaler and does not
+            # support scaler selection
             cmd.extend(["-s", size_preset])
     
+    if filters:
+        cmd.extend(["-vf", ",".join(filters)])
+    
     # Format-specific settings
     if format_preset["ext"] == "webm":
         # WebM settings
@@ -327,6 +379,8 @@ def process_video():
         video_info = get_video_info(input_file)
         if video_info:
             print(f"Video dimensions: {video_info['width']}x{video_info['height']}")
+            if video_info["fps"] > 0:
+                print(f"Frame rate: {video_info['fps']:g} fps")
         
         # Get format preset (設定ファイルからデフォルト値を取得)
         format_preset = print_menu(FORMAT_PRESETS, "Select output format", default=config.get_default_format())
@@ -337,10 +391,27 @@ def process_video():
         # Get bitrate preset (設定ファイルからデフォルト値を取得)
         bitrate_preset = print_menu(BITRATE_PRESETS, "Select bitrate", default=config.get_default_bitrate())
         
+        # Get fps preset (設定ファイルからデフォルト値を取得)
+        default_fps = config.get_default_fps()
+        if default_fps not in FPS_PRESETS:
+            default_fps = "1"
+        fps_preset = print_menu(FPS_PRESETS, "Select frame rate cap", default=default_fps)
+        max_fps = resolve_max_fps(fps_preset, size_preset)
+        
+        # Get scaler preset (only relevant when resizing)
+        scaler_preset = SCALER_PRESETS["1"]
+        if size_preset["value"] != "original":
+            default_scaler = config.get_default_scaler()
+            if default_scaler not in SCALER_PRESETS:
+                default_scaler = "1"
+            scaler_preset = print_menu(SCALER_PRESETS, "Select scaling method", default=default_scaler)
+        
         # Start encoding
         print("\nStarting encoding...")
         print(f"Input file: {input_file}")
         print(f"Output format: {format_preset['name']}")
+        if video_info and should_cap_fps(video_info["fps"], max_fps):
+            print(f"Frame rate cap: {video_info['fps']:g} fps -> {max_fps} fps")
         output_dir = config.get_output_dir()
         print(f"Output directory: {output_dir}")
         
@@ -350,6 +421,8 @@ def process_video():
             size_preset["value"], 
             bitrate_preset["value"], 
             format_preset,
+            max_fps=max_fps,
+            scaler=scaler_preset["value"],
             progress_callback=print_progress
         )
         